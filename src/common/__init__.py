@@ -6,6 +6,7 @@ from src.common.normalize_log_weights import normalize_log_weights
 from src.common.state import (
     Gaussian,
     GaussianMixture,
+    GaussianMixtureArrays,
     ObjectMetadata,
     Observation,
     ObservationList,
@@ -1,9 +1,10 @@
 import copy
 import logging
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 import numpy.typing as npt
+import scipy.linalg  # noqa: I201
 import scipy.stats  # noqa: I201
 
 from src.common.normalize_log_weights import normalize_log_weights
@@ -35,12 +36,53 @@ class GaussianDensity:
         next_P = np.linalg.multi_dot([next_F, state.P, next_F.T]) + motion_model.Q(dt)
         return Gaussian(next_x, next_P)
 
+    @staticmethod
+    def predict_vectorized(states: GaussianMixture, motion_model: MotionModel, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Performs Kalman prediction step for every component of a Gaussian mixture at once
+
+        Args:
+            states (GaussianMixture): mixture of states
+            motion_model (MotionModel): a structure specifies the motion model parameters
+
+        Returns:
+            next_states (np.ndarray (number of components) x (state dim)): predicted means
+            next_covariances (np.ndarray (number of components) x (state dim) x (state dim)): predicted covariances
+        """
+        if not motion_model.is_linear:
+            predicted_states = [GaussianDensity.predict(state, motion_model, dt) for state in states.states]
+            return np.array([state.x for state in predicted_states]), np.array([state.P for state in predicted_states])
+
+        states_np, covariances_np = states.states_np, states.covariances_np
+        F = motion_model.F(states_np[0], dt)
+        next_states = states_np @ F.T
+        next_covariances = F @ covariances_np @ F.T + motion_model.Q(dt)
+        return next_states, next_covariances
+
     @staticmethod
     def update_states_with_likelihoods_by_single_measurement(
         initial_states: GaussianMixture,
         measurement: np.ndarray,
         measurement_model: MeasurementModel,
     ):
+        new_states, next_covariances, loglikelihoods = GaussianDensity.update_states_with_likelihoods_by_single_measurement_vectorized(
+            initial_states, measurement, measurement_model
+        )
+        next_states = [Gaussian(new_states[idx], next_covariances[idx]) for idx in range(initial_states.size)]
+        return next_states, loglikelihoods
+
+    @staticmethod
+    def update_states_with_likelihoods_by_single_measurement_vectorized(
+        initial_states: GaussianMixture,
+        measurement: np.ndarray,
+        measurement_model: MeasurementModel,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Performs Kalman update of every component of a Gaussian mixture by a single measurement
+
+        Returns:
+            new_states (np.ndarray (number of components) x (state dim)): updated means
+            next_covariances (np.ndarray (number of components) x (state dim) x (state dim)): updated covariances
+            loglikelihoods (np.ndarray (number of components)): predicted likelihoods of the measurement
+        """
         H_x = measurement_model.H(initial_states.states_np)
         # Innovation covariance
         S = H_x @ initial_states.covariances_np @ H_x.T + measurement_model.R
@@ -59,8 +101,6 @@ class GaussianDensity:
 
         next_covariances = (np.eye(state_vector_size) - K @ H_x) @ initial_states.covariances_np
 
-        next_states = [Gaussian(new_states[idx], next_covariances[idx]) for idx in range(initial_states.size)]
-
         measurements_bar = np.expand_dims(H_x, axis=0) @ initial_states.states_np.T
 
         loglikelihoods_fast = vectorized_gaussian_logpdf(
@@ -69,7 +109,7 @@ class GaussianDensity:
             covariances=np.diagonal(S, axis1=2),
         )
 
-        return next_states, loglikelihoods_fast
+        return new_states, next_covariances, loglikelihoods_fast
 
     @staticmethod
     def numpy_get_Kalman_gain(initial_states: GaussianMixture, measurement_model: MeasurementModel):
@@ -228,12 +268,14 @@ class GaussianDensity:
     @staticmethod
     def predict_loglikelihood(state_pred: Gaussian, z: npt.ArrayLike, measurement_model: MeasurementModel) -> np.ndarray:
         """Calculates the predicted likelihood in logarithm domain
+        Args:
+            z (np.ndarray (number of measurements) x (measurement dim)): measurements,
+                                                                        a single measurement can be passed as a vector
         Returns:
             predicted_loglikelihood (np.ndarray (number of measurements)): predicted likelihood
                                                                         for each measurement
         """
-
-        assert z.ndim == 2
+        z = np.atleast_2d(z)
         assert z.shape[1] == measurement_model.dim
         # Measurement model Jacobian (z_bar)
         H_x = measurement_model.H(state_pred.x)
@@ -245,9 +287,17 @@ class GaussianDensity:
         S = H_x @ state_pred.P @ H_x.T + measurement_model.R
         S = (S + S.T) / 2  # Make sure matrix S is positive definite
 
-        predicted_loglikelihood = np.zeros(z.shape[0])  # size - num of measurements
-        for idx in range(z.shape[0]):
-            predicted_loglikelihood[idx] = scipy.stats.multivariate_normal.logpdf(z[idx], z_bar, S, allow_singular=True)
+        try:
+            S_cho = scipy.linalg.cho_factor(S, lower=True)
+        except np.linalg.LinAlgError:
+            logging.warning("S is not positive definite, use pseudo inverse")
+            return np.atleast_1d(scipy.stats.multivariate_normal.logpdf(z, z_bar, S, allow_singular=True))
+
+        # One Cholesky factorization for all measurements
+        z_diff = (z - z_bar).T
+        Machlanobis_dist = np.einsum("ij,ij->j", z_diff, scipy.linalg.cho_solve(S_cho, z_diff))
+        log_det_S = 2 * np.log(np.diag(S_cho[0])).sum()
+        predicted_loglikelihood = -0.5 * (Machlanobis_dist + log_det_S + measurement_model.dim * np.log(2 * np.pi))
 
         assert predicted_loglikelihood.shape[0] == z.shape[0]
         return predicted_loglikelihood
@@ -294,24 +344,70 @@ class GaussianDensity:
         # Difference between measurement and prediction
         z_diff = z - z_bar
 
-        num_of_measurements = z.shape[0]
-
-        # Squared Mahalanobis distance
-        Machlanobis_dist = np.zeros(num_of_measurements)
-
-        # TODO vectorize this
-        for i in range(num_of_measurements):
-            try:
-                Machlanobis_dist[i] = z_diff[i] @ np.linalg.inv(S) @ z_diff[i].T
-            except np.linalg.LinAlgError:
-                logging.warning("It seems, cannot inverse S, skip step")
-                return np.array([]), []
+        # Squared Mahalanobis distance, one Cholesky factorization for all measurements
+        try:
+            S_cho = scipy.linalg.cho_factor(S, lower=True)
+        except np.linalg.LinAlgError:
+            logging.warning("It seems, cannot inverse S, skip step")
+            return np.array([]), []
+        Machlanobis_dist = np.einsum("ij,ji->i", z_diff, scipy.linalg.cho_solve(S_cho, z_diff.T))
 
         indices_in_gate = Machlanobis_dist < gating_size
         assert Machlanobis_dist.shape[0] == z.shape[0]
         z_ingate = z[indices_in_gate]
         return z_ingate, indices_in_gate
 
+    @staticmethod
+    def ellipsoidal_gating_vectorized(
+        states: GaussianMixture,
+        z: npt.ArrayLike,
+        measurement_model: MeasurementModel,
+        gating_size: float,
+    ) -> np.ndarray:
+        """Performs ellipsoidal gating for every component of a Gaussian mixture at once
+
+        Args:
+            states (GaussianMixture): predicted states
+            z (np.ndarray (number of measurements) x (measurements dimenstion)): measurements
+            measurement_model (MeasurementModel): specifies the measurement model parameters
+            gating_size (float): gating size
+
+        Returns:
+            gating_matrix (np.ndarray (number of components) x (number of measurements)):
+                boolean matrix indicating whether the measurement is in the gate of the component
+        """
+        if states.size == 0 or z.size == 0:
+            return np.full(shape=[states.size, len(z)], fill_value=False)
+        assert z.shape[1] == measurement_model.dim
+
+        states_np, covariances_np = states.states_np, states.covariances_np
+
+        # Measurements model Jacobian
+        H_x = measurement_model.H(states_np)
+
+        # Innovation covariance, make sure matrices S are positive definite
+        S = H_x @ covariances_np @ H_x.T
+        S = 0.5 * (S + np.transpose(S, axes=(0, 2, 1)))
+        is_invertible = np.full(states.size, True)
+        try:
+            S_inv = np.linalg.inv(S)
+        except np.linalg.LinAlgError:
+            # a singular S fails only its own component, as in the per component gating
+            logging.warning("It seems, cannot inverse S, skip components with singular S")
+            S_inv = np.zeros_like(S)
+            for idx in range(states.size):
+                try:
+                    S_inv[idx] = np.linalg.inv(S[idx])
+                except np.linalg.LinAlgError:
+                    is_invertible[idx] = False
+
+        # Difference between measurements and predictions: (components x measurements x measurement dim)
+        z_diff = z[None, :, :] - measurement_model.h(states_np.T).T[:, None, :]
+
+        # Squared Mahalanobis distance for every (component, measurement) pair
+        Machlanobis_dist = np.einsum("kmi,kij,kmj->km", z_diff, S_inv, z_diff)
+        return (Machlanobis_dist < gating_size) & is_invertible[:, None]
+
     @staticmethod
     def moment_matching(weights: List[float], states: List[Gaussian]) -> Gaussian:
         """Aproximates a Gaussian mixture density as a single Gaussian using moment matching
@@ -360,13 +456,33 @@ class GaussianDensity:
         if len(log_weights) == 0:
             return
 
+        means = np.array([state.x for state in states])
+        covariances = np.array([state.P for state in states])
+        return GaussianDensity.moment_matching_arrays(log_weights, means, covariances)
+
+    @staticmethod
+    def moment_matching_arrays(log_weights: np.ndarray, means: np.ndarray, covariances: np.ndarray) -> Gaussian:
+        """Aproximates a Gaussian mixture density given as stacked arrays as a single Gaussian
+
+        Args:
+            log_weights (np.ndarray (number of components)): normalized weights in logarithm domain
+            means (np.ndarray (number of components) x (state dim)): means of components
+            covariances (np.ndarray (number of components) x (state dim) x (state dim)): covariances of components
+
+        Returns:
+            Gaussian: resulted mixture
+        """
+        if len(log_weights) == 0:
+            return
+
         weights = np.exp(log_weights)
+        weights = weights / weights.sum()
 
-        x_bar_np = np.average(np.array([state.x for state in states]), axis=0, weights=weights)
-        delta_state = x_bar_np - np.array([state.x for state in states])
-        ps = np.array([state.P for state in states]).T + np.einsum("ij,ij->i", delta_state, delta_state)
+        x_bar_np = weights @ means
+        delta_state = x_bar_np - means
+        spread = np.einsum("ij,ij->i", delta_state, delta_state)
 
-        P_bar_np = np.average(ps.T, axis=0, weights=weights)
+        P_bar_np = np.einsum("i,ijk->jk", weights, covariances) + weights @ spread
         matched_state = Gaussian(x=x_bar_np, P=P_bar_np)
         return matched_state
 
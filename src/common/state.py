@@ -127,6 +127,10 @@ class GaussianMixture(UserList):
         for idx in range(len(self.data)):
             self.weighted_components[idx].log_weights = log_weights[idx]
 
+    @property
+    def log_weights_np(self):
+        return np.fromiter((x.log_weight for x in self.data), dtype=np.float64, count=len(self.data))
+
     @property
     def size(self):
         return len(self.data)
@@ -144,6 +148,82 @@ class GaussianMixture(UserList):
         return np.array([state.gaussian.P for state in self.data])
 
 
+class GaussianMixtureArrays:
+    """Gaussian mixture stored as contiguous arrays instead of list of components
+
+    Parameters
+    ----------
+    log_weights : np.ndarray (K), K - number of components
+        log weights of components
+    means : np.ndarray (K x N), N - state dimension
+        state vectors of components
+    covs : np.ndarray (K x N x N), N - state dimension
+        covariances of components
+    """
+
+    def __init__(self, log_weights: np.ndarray, means: np.ndarray, covs: np.ndarray):
+        self.log_weights = np.asarray(log_weights, dtype=np.float64)
+        self.means = np.asarray(means, dtype=np.float64)
+        self.covs = np.asarray(covs, dtype=np.float64)
+        assert len(self.log_weights) == len(self.means) == len(self.covs), "number of components should be equal!"
+
+    @classmethod
+    def from_gaussian_mixture(cls, gaussian_mixture: GaussianMixture) -> "GaussianMixtureArrays":
+        if not gaussian_mixture:
+            return cls(np.empty(0), np.empty((0, 0)), np.empty((0, 0, 0)))
+        return cls(gaussian_mixture.log_weights_np, gaussian_mixture.states_np, gaussian_mixture.covariances_np)
+
+    def to_gaussian_mixture(self) -> GaussianMixture:
+        return GaussianMixture(list(self))
+
+    def __len__(self):
+        return len(self.log_weights)
+
+    def __getitem__(self, idx: int) -> WeightedGaussian:
+        return WeightedGaussian(float(self.log_weights[idx]), Gaussian(self.means[idx], self.covs[idx]))
+
+    def __iter__(self):
+        return (self[idx] for idx in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} components={list(self)}"
+
+    @property
+    def size(self):
+        return len(self)
+
+    @property
+    def log_weights_np(self):
+        return self.log_weights
+
+    @property
+    def states(self):
+        return [Gaussian(x, P) for x, P in zip(self.means, self.covs)]
+
+    @property
+    def states_np(self):
+        return self.means
+
+    @property
+    def covariances_np(self):
+        return self.covs
+
+    def select(self, mask: np.ndarray) -> "GaussianMixtureArrays":
+        return GaussianMixtureArrays(self.log_weights[mask], self.means[mask], self.covs[mask])
+
+    def extend(self, other) -> None:
+        if isinstance(other, GaussianMixture):
+            other = GaussianMixtureArrays.from_gaussian_mixture(other)
+        if not other:
+            return
+        if not self:
+            self.log_weights, self.means, self.covs = other.log_weights.copy(), other.means.copy(), other.covs.copy()
+            return
+        self.log_weights = np.concatenate([self.log_weights, other.log_weights])
+        self.means = np.concatenate([self.means, other.means])
+        self.covs = np.concatenate([self.covs, other.covs])
+
+
 class _GaussianMixture(collections.abc.MutableSequence):
     def __init__(self, weighted_components: List[WeightedGaussian] = (None)):
         self.weighted_components = deepcopy(weighted_components)
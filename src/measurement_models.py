@@ -2,6 +2,9 @@ import numpy as np
 
 
 class MeasurementModel:
+    # observation matrix does not depend on the state vector
+    is_linear = False
+
     def __init__(self, random_state=None, *args, **kwargs):
         self._generator = np.random.RandomState(random_state)
 
@@ -28,6 +31,8 @@ class MeasurementModel:
 
 
 class ConstantVelocityMeasurementModel(MeasurementModel):
+    is_linear = True
+
     def __init__(self, sigma_r, *args, **kwargs):
         """Creates the measurement model for a 2D nearly constant velocity motion model
 
@@ -45,16 +50,21 @@ class ConstantVelocityMeasurementModel(MeasurementModel):
         """
         self.dim = 2
         self.R = (sigma_r**2) * np.eye(2)
+        # observation matrix is constant, it is built once and shared between calls, so it is read-only
+        self._H = np.array([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]])
+        self._H.setflags(write=False)
         super().__init__(*args, **kwargs)
 
     def H(self, state_vector):
-        return np.array([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]])
+        return self._H
 
     def h(self, state_vector):
         return self.H(state_vector) @ state_vector
 
 
 class NuscenesConstantVelocityMeasurementModel(MeasurementModel):
+    is_linear = True
+
     def __init__(self, sigma_r, *args, **kwargs):
         """Creates the measurement model for a 2D nearly constant velocity motion model
 
@@ -73,10 +83,13 @@ class NuscenesConstantVelocityMeasurementModel(MeasurementModel):
 
         self.dim = 3
         self.R = (sigma_r**2) * np.eye(3)
+        # observation matrix is constant, it is built once and shared between calls, so it is read-only
+        self._H = np.concatenate((np.eye(3), np.zeros((3, 3))), axis=1)
+        self._H.setflags(write=False)
         super().__init__(*args, **kwargs)
 
     def H(self, state_vector):
-        return np.concatenate((np.eye(3), np.zeros((3, 3))), axis=1)
+        return self._H
 
     def h(self, state_vector):
         return self.H(state_vector) @ state_vector
@@ -1,7 +1,30 @@
+from functools import wraps
+
 import numpy as np
 
 
+def _cache_by_dt(method):
+    """Memoizes model matrices which depend only on the time step.
+    Cached matrices are shared between calls, so they are made read-only."""
+
+    @wraps(method)
+    def _wrapped_method(self, *args, **kwargs):
+        dt = kwargs["dt"] if "dt" in kwargs else args[-1]
+        cache = self.__dict__.setdefault("_matrices_cache", {})
+        key = (method.__name__, dt)
+        if key not in cache:
+            matrix = method(self, *args, **kwargs)
+            matrix.setflags(write=False)
+            cache[key] = matrix
+        return cache[key]
+
+    return _wrapped_method
+
+
 class MotionModel:
+    # transition matrix does not depend on the state vector
+    is_linear = False
+
     def __init__(self, random_state: int, d: int, *args, **kwargs):
         self._generator = np.random.RandomState(random_state)
         self.d = d
@@ -20,14 +43,18 @@ class MotionModel:
 
 
 class ConstantVelocityMotionModel(MotionModel):
+    is_linear = True
+
     def __init__(self, random_state: int, sigma_q: float, *args, **kwargs):
         super().__init__(random_state, d=4)  # 4 states: x, y, vx, vy
         self.sigma = sigma_q
 
+    @_cache_by_dt
     def F(self, state_vector: np.ndarray, dt: float) -> np.ndarray:
         """Transition matrix for constant velocity model"""
         return np.array([[1.0, 0.0, dt, 0.0], [0.0, 1.0, 0.0, dt], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]])
 
+    @_cache_by_dt
     def Q(self, dt: float) -> np.ndarray:
         """Motion noise covariance for constant velocity model"""
         return self.sigma**2 * np.array(
@@ -59,16 +86,20 @@ class CoordinateTurnMotionModel(MotionModel):
             ]
         )
 
+    @_cache_by_dt
     def Q(self, dt: float) -> np.ndarray:
         """Motion noise covariance for coordinate turn model"""
         return np.diag([0, 0, self.sigma_v**2, 0, self.sigma_omega**2])
 
 
 class ConstantAccelerationMotionModel(MotionModel):
+    is_linear = True
+
     def __init__(self, random_state: int, sigma_a: float, *args, **kwargs):
         super().__init__(random_state, d=6)  # 6 states: x, y, vx, vy, ax, ay
         self.sigma_a = sigma_a
 
+    @_cache_by_dt
     def F(self, state_vector: np.ndarray, dt: float) -> np.ndarray:
         """Transition matrix for constant acceleration model"""
         return np.array(
@@ -82,6 +113,7 @@ class ConstantAccelerationMotionModel(MotionModel):
             ]
         )
 
+    @_cache_by_dt
     def Q(self, dt: float) -> np.ndarray:
         """Motion noise covariance for constant acceleration model"""
         sigma_a2 = self.sigma_a**2
@@ -21,6 +21,7 @@ from src.utils.visualizer.common.plot_series import (
     plot_estimations,
     plot_measurement_scene,
     plot_object_data,
+    scenes_to_arrays,
 )
 
 
@@ -36,7 +37,7 @@ def prepare_scenario(object_configs, total_time, env_motion_model, env_sensor_mo
     env_gt = GroundTruthConfig(object_configs, total_time)
     env_object_data = ObjectData(ground_truth_config=env_gt, motion_model=env_motion_model, if_noisy=False)
     meas_data_gen = MeasurementData(object_data=env_object_data, sensor_model=env_sensor_model, meas_model=env_meas_model)
-    meas_data = [next(meas_data_gen) for _ in range(total_time)]
+    meas_data = meas_data_gen.generate_batch()
     return env_gt, env_object_data, meas_data
 
 
@@ -64,13 +65,10 @@ def visulaize(object_data, meas_data, tracker_estimations, filepath):
 
     if object_data is not None:
         object_colors = colorcet.glasbey_category10[4:]
-        for timestep in range(simulation_steps):
-            objects_in_scene = object_data[timestep]
-            for object_id in objects_in_scene.keys():
-                state = objects_in_scene[object_id]
-                gt_pos_x, gt_pos_y = state.x[:2]
-                axs[1, 0].scatter(timestep, gt_pos_x, color=object_colors[object_id % 252])
-                axs[2, 0].scatter(gt_pos_y, timestep, color=object_colors[object_id % 252])
+        timesteps, object_ids, states = scenes_to_arrays(object_data[timestep] for timestep in range(simulation_steps))
+        colors = [object_colors[object_id % 252] for object_id in object_ids]
+        axs[1, 0].scatter(timesteps, states[:, 0], color=colors)
+        axs[2, 0].scatter(states[:, 1], timesteps, color=colors)
 
     setup_ax(axs[1, 1], "observation x pos over time", xlim=(0, simulation_steps), aspect="auto", xlabel="time", ylabel="x position")
     axs[1, 1].set_xticks(np.arange(0, simulation_steps, step=10))
@@ -86,18 +84,10 @@ def visulaize(object_data, meas_data, tracker_estimations, filepath):
     axs[2, 2].set_yticks(np.arange(0, simulation_steps, step=10))
 
     if tracker_estimations is not None:
-        for timestep in range(len(tracker_estimations)):
-            objects_in_scene = tracker_estimations[timestep]
-            if objects_in_scene is None:
-                continue
-            for object_id, state in objects_in_scene.items():
-                curr_color, curr_marker = (
-                    OBJECT_COLORS[object_id],
-                    OBJECT_MARKER,
-                )
-                est_pos_x, est_pos_y = state.x[:2]
-                axs[1, 2].scatter(timestep, est_pos_x, color=curr_color, marker=curr_marker)
-                axs[2, 2].scatter(est_pos_y, timestep, color=curr_color, marker=curr_marker)
+        timesteps, object_ids, states = scenes_to_arrays(tracker_estimations)
+        colors = [OBJECT_COLORS[object_id] for object_id in object_ids]
+        axs[1, 2].scatter(timesteps, states[:, 0], color=colors, marker=OBJECT_MARKER)
+        axs[2, 2].scatter(states[:, 1], timesteps, color=colors, marker=OBJECT_MARKER)
 
     params = {}
     if object_data is not None and tracker_estimations is not None:
@@ -237,21 +227,17 @@ def animate(object_data, meas_data, tracker_estimations, output_filename):
     save_figures_to_gif(images, output_filename)
 
 
-def generate_environment(object_configs, total_time, env_motion_model, env_meas_model, env_P_D, env_lambda_c, env_range_c):
+def generate_environment(object_configs, total_time, env_motion_model, env_meas_model, env_P_D, env_lambda_c, env_range_c, random_state=None):
     ground_truth = GroundTruthConfig(object_configs, total_time)
     env_sensor_model = SensorModelConfig(env_P_D, env_lambda_c, env_range_c)
     object_data = ObjectData(ground_truth, env_motion_model, if_noisy=False)
-    meas_data_gen = MeasurementData(object_data, env_sensor_model, env_meas_model)
-    meas_data = [next(meas_data_gen) for _ in range(total_time)]
+    meas_data_gen = MeasurementData(object_data, env_sensor_model, env_meas_model, random_state=random_state)
+    meas_data = meas_data_gen.generate_batch()
     return ground_truth, env_sensor_model, object_data, meas_data
 
 
 def run_tracker(
-    object_configs: tp.List,
-    total_time: int,
-    env_P_D: float,
-    env_lambda_c: float,
-    env_range_c,
+    environment: tp.Tuple,
     env_motion_model: MotionModel,
     env_meas_model: MeasurementModel,
     tracker,
@@ -262,7 +248,9 @@ def run_tracker(
     tracker_sensor_model: SensorModelConfig = None,
     tracker_P_G: float = 0.999,
 ):
-    ground_truth, env_sensor_model, object_data, meas_data = generate_environment(object_configs, total_time, env_motion_model, env_meas_model, env_P_D, env_lambda_c, env_range_c)
+    # environment (ground_truth, sensor_model, object_data, meas_data) is simulated by generate_environment
+    # with env_motion_model and env_meas_model, so it can be shared between trackers
+    ground_truth, env_sensor_model, object_data, meas_data = environment
 
     tracker_meas_model = env_meas_model if tracker_meas_model is None else tracker_meas_model
     tracker_motion_model = env_motion_model if tracker_motion_model is None else tracker_motion_model
@@ -272,7 +260,8 @@ def run_tracker(
     if tracker is not None:
         tracker_model = tracker(meas_model=tracker_meas_model, sensor_model=tracker_sensor_model, motion_model=tracker_motion_model, gating_size=tracker_P_G, **tracker_params)
         tracker_estimations = track(object_data, meas_data, tracker_model)
-    visulaize(object_data, meas_data, tracker_estimations, filepath)
+    if os.getenv("VISUALIZE", "True") == "True":
+        visulaize(object_data, meas_data, tracker_estimations, filepath)
     if tracker_estimations is not None:
         gospa = get_gospa(object_data, tracker_estimations)  # noqa
         motmetrics = get_motmetrics(object_data, tracker_estimations)  # noqa F841
@@ -75,12 +75,54 @@ class MeasurementData:
             sources = [obj_id for obj_id, _ in observed_objects]
             return object_observations, sources
 
+    def generate_batch(self):
+        """Generates measurements and clutter for all timesteps at once
+
+        Returns:
+            meas_data (list of tuples): (timestep, measurements, sources) for every timestep,
+                                        the same as iterating over the generator
+        """
+        total_time = len(self.object_data)
+        objects = [(timestep, obj_id, obj) for timestep in range(total_time) for obj_id, obj in self.object_data[timestep].items()]
+
+        # Generate misses
+        detection_mask = self._generator.uniform(size=len(objects)) < self.sensor_model.P_D
+        observed_objects = [observed_object for is_observed, observed_object in zip(detection_mask, objects) if is_observed]
+
+        # Generate measurements, one noise draw for all of them
+        object_timesteps = np.array([timestep for timestep, _, _ in observed_objects], dtype=int)
+        object_sources = np.array([obj_id for _, obj_id, _ in observed_objects], dtype=int)
+        object_observations = np.array([self.meas_model.H(obj.x) @ obj.x for _, _, obj in observed_objects]).reshape(-1, self.meas_model.dim)
+        object_observations += self._generator.standard_normal(object_observations.shape) @ np.linalg.cholesky(self.meas_model.R).T
+
+        # Generate clutter
+        clutter_counts = self._generator.poisson(lam=self.sensor_model.lambda_c, size=total_time)
+        clutter_min_coord, clutter_max_coord = np.diag(self.sensor_model.range_c)
+        clutter_observations = self._generator.uniform(clutter_min_coord, clutter_max_coord, [clutter_counts.sum(), self.meas_model.dim])
+
+        object_splits = np.searchsorted(object_timesteps, np.arange(1, total_time))
+        clutter_splits = np.cumsum(clutter_counts)[:-1]
+        return [
+            (
+                timestep,
+                np.concatenate([observations, clutter], axis=0),
+                np.concatenate([sources, np.full(len(clutter), -1)], axis=0),
+            )
+            for timestep, (observations, sources, clutter) in enumerate(
+                zip(
+                    np.split(object_observations, object_splits),
+                    np.split(object_sources, object_splits),
+                    np.split(clutter_observations, clutter_splits),
+                )
+            )
+        ]
+
     def generate_clutter(self):
         # Number of clutter measurements
         N_c = self._generator.poisson(lam=self.sensor_model.lambda_c)
         clutter_min_coord, clutter_max_coord = np.diag(self.sensor_model.range_c)
-        clutter_observations = np.random.uniform(clutter_min_coord, clutter_max_coord, [N_c, self.meas_model.dim])
-        clutter_sources = [-1] * N_c
+        clutter_observations = self._generator.uniform(clutter_min_coord, clutter_max_coord, [N_c, self.meas_model.dim])
+        clutter_sources = np.full(N_c, -1)
         return clutter_observations, clutter_sources
 
     def __iter__(self):
@@ -1,5 +1,7 @@
 import copy
 
+import numpy as np
+
 from ..configs.ground_truth_config import GroundTruthConfig
 from ..motion_models import MotionModel
 
@@ -41,15 +43,21 @@ class ObjectData:
 
     def generate_objects_data(self):
         object_state_history = [{} for timestep in range(self._ground_truth_config.total_time)]
+        dt = 1.0
+        if self._if_noisy:
+            # Q may be singular, factorize it once and draw all the motion noise of the object in one go
+            eigenvalues, eigenvectors = np.linalg.eigh(self._motion_model.Q(dt))
+            Q_sqrt = eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
         for object_config in self._ground_truth_config.object_configs:
             state = copy.deepcopy(object_config.initial_state)
-            for timestep in range(self._ground_truth_config.total_time):
-                if timestep in range(object_config.t_birth, object_config.t_death):
-                    object_state_history[timestep][object_config.id] = copy.copy(state)
-                    dt = 1.0
-                    next_mean = self._motion_model.f(state.x, dt)
-                    state.P = self._motion_model.Q(dt)
-                    state.x = self._motion_model._generator.multivariate_normal(next_mean, state.P) if self._if_noisy else next_mean
+            lifetime = range(max(object_config.t_birth, 0), min(object_config.t_death, self._ground_truth_config.total_time))
+            if self._if_noisy:
+                motion_noise = self._motion_model._generator.standard_normal((len(lifetime), len(state.x))) @ Q_sqrt.T
+            for idx, timestep in enumerate(lifetime):
+                object_state_history[timestep][object_config.id] = copy.copy(state)
+                next_mean = self._motion_model.f(state.x, dt)
+                state.P = self._motion_model.Q(dt)
+                state.x = next_mean + motion_noise[idx] if self._if_noisy else next_mean
         return tuple(object_state_history)
 
     def __repr__(self) -> str:
@@ -2,6 +2,7 @@
 
 from src.trackers.multiple_object_trackers.PMBM.common.assigner import (
     AssignmentSolver,
+    CostMatrixBuffer,
     assign,
 )
 from src.trackers.multiple_object_trackers.PMBM.common.bernoulli import Bernoulli
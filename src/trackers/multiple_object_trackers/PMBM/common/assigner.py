@@ -1,97 +1,101 @@
-import itertools
 import logging as lg
-from collections import defaultdict
-from typing import Dict, List
+import math
+from typing import Dict, List, Tuple
 
 import numpy as np
-from murty import Murty
 
 from .global_hypothesis import Association, GlobalHypothesis
+from .murty_solver import MurtySolver
+
+
+class CostMatrixBuffer:
+    """Storage reused by cost matrices of consecutive assignment problems.
+    Arrays taken from the buffer are valid until the next call of get."""
+
+    def __init__(self):
+        self._costs = np.empty((0, 0))
+        self._track_ids = np.empty((0, 0), dtype=np.int64)
+        self._sth_ids = np.empty((0, 0), dtype=np.int64)
+
+    def get(self, shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns (cost matrix filled with inf, track id map and sth id map filled with -1) of the shape"""
+        if self._costs.shape[0] < shape[0] or self._costs.shape[1] < shape[1]:
+            grown_shape = (max(self._costs.shape[0], shape[0]), max(self._costs.shape[1], shape[1]))
+            self._costs = np.empty(grown_shape)
+            self._track_ids = np.empty(grown_shape, dtype=np.int64)
+            self._sth_ids = np.empty(grown_shape, dtype=np.int64)
+        cost_matrix, track_id_map, sth_id_map = (array[: shape[0], : shape[1]] for array in (self._costs, self._track_ids, self._sth_ids))
+        cost_matrix.fill(np.inf)
+        track_id_map.fill(-1)
+        sth_id_map.fill(-1)
+        return cost_matrix, track_id_map, sth_id_map
 
 
 class CostMatrix:
-    def __init__(self, global_hypothesis: GlobalHypothesis, old_tracks: Dict, new_tracks: Dict, measurements) -> None:
+    def __init__(self, global_hypothesis: GlobalHypothesis, old_tracks: Dict, new_tracks: Dict, measurements, cost_buffer: CostMatrixBuffer = None) -> None:
         self.global_hypothesis = global_hypothesis
         self.old_tracks = old_tracks
         self.new_tracks = new_tracks
         self.measurements = measurements
-        self.column_row_to_detected_child_sth = defaultdict(defaultdict)
-        self.column_row_to_new_detected_sth = defaultdict(defaultdict)
-        self.num_of_old_tracks = len(list(self.global_hypothesis.associations))
+        self.cost_buffer = cost_buffer
+        self._assocs = tuple(self.global_hypothesis.associations)
+        self.num_of_old_tracks = len(self._assocs)
         self.cost_matrix = self.create_cost_matrix()
 
     def __repr__(self) -> str:
+        if self.cost_matrix is None:
+            return "cost matrix = released"
         return f"cost matrix = {self.cost_matrix}"
 
     def create_cost_matrix(self):
-        cost_detected = self.create_cost_for_associated_targets(self.global_hypothesis, self.old_tracks, self.measurements)
-        cost_undetected = self.create_cost_for_undetected(self.new_tracks, self.measurements)
-        cost_matrix = np.hstack([cost_detected, cost_undetected])
+        shape = (len(self.measurements), self.num_of_old_tracks + len(self.measurements))
+        if self.cost_buffer is not None:
+            cost_matrix, self.track_id_map, self.sth_id_map = self.cost_buffer.get(shape)
+        else:
+            cost_matrix = np.full(shape, np.inf)
+            self.track_id_map = np.full(shape, -1, dtype=np.int64)
+            self.sth_id_map = np.full(shape, -1, dtype=np.int64)
+        # (row, column) -> child sth lookup tables share the layout of the cost matrix, -1 marks cells without a hypothesis,
+        # both blocks are filled in place
+        detected, undetected = np.s_[:, : self.num_of_old_tracks], np.s_[:, self.num_of_old_tracks :]
+        self.create_cost_for_associated_targets(self._assocs, self.old_tracks, cost_matrix[detected], self.track_id_map[detected], self.sth_id_map[detected])
+        self.create_cost_for_undetected(self.new_tracks, cost_matrix[undetected], self.track_id_map[undetected], self.sth_id_map[undetected])
         return cost_matrix
 
-    def create_cost_for_associated_targets(self, global_hypothesis: GlobalHypothesis, old_tracks, measurements) -> np.ndarray:
-        cost_detected = np.full((len(measurements), len(list(global_hypothesis.associations))), np.inf)
-        for column_idx, (track_idx, parent_sth_idx) in enumerate(global_hypothesis.associations):
+    def release(self) -> None:
+        """Drops the arrays once the problem is solved, buffered ones are reused by the next problem"""
+        if self.cost_buffer is not None:
+            self.cost_matrix = self.track_id_map = self.sth_id_map = None
+
+    @staticmethod
+    def create_cost_for_associated_targets(associations: Tuple[Association], old_tracks, cost_detected: np.ndarray, track_id_map: np.ndarray, sth_id_map: np.ndarray) -> np.ndarray:
+        for column_idx, (track_idx, parent_sth_idx) in enumerate(associations):
             parent_sth = old_tracks[track_idx].single_target_hypotheses[parent_sth_idx]
-            for meas_idx, sth in parent_sth.detection_hypotheses.items():
-                cost_detected[meas_idx, column_idx] = sth.cost
-                self.column_row_to_detected_child_sth[column_idx][meas_idx] = (
-                    track_idx,
-                    parent_sth_idx,
-                    meas_idx,
-                    sth.sth_id,
-                )
+            detection_hypotheses = parent_sth.detection_hypotheses
+            meas_idxs_col = np.fromiter(detection_hypotheses.keys(), dtype=np.int64, count=len(detection_hypotheses))
+            cost_detected[meas_idxs_col, column_idx] = np.fromiter((sth.cost for sth in detection_hypotheses.values()), dtype=np.float64, count=len(detection_hypotheses))
+            track_id_map[meas_idxs_col, column_idx] = track_idx
+            sth_id_map[meas_idxs_col, column_idx] = np.fromiter((sth.sth_id for sth in detection_hypotheses.values()), dtype=np.int64, count=len(detection_hypotheses))
         return cost_detected
 
-    def create_cost_for_undetected(self, new_tracks, measurements) -> np.ndarray:
+    @staticmethod
+    def create_cost_for_undetected(new_tracks, cost_undetected: np.ndarray, track_id_map: np.ndarray, sth_id_map: np.ndarray) -> np.ndarray:
         # Using association between measurements and previously undetected objects
-        cost_undetected = np.full((len(measurements), len(measurements)), np.inf)
         sth_idx = 0  # we have olny one sth for new targets
-        for meas_idx in range(len(measurements)):
-            if meas_idx in [track.single_target_hypotheses[sth_idx].meas_idx for track in new_tracks.values()]:
-                track_id = [track.track_id for track in new_tracks.values() if track.single_target_hypotheses[sth_idx].meas_idx == meas_idx][0]
-                cost_undetected[meas_idx, meas_idx] = new_tracks[track_id].single_target_hypotheses[sth_idx].cost
-                self.column_row_to_new_detected_sth[meas_idx] = Association(
-                    new_tracks[track_id].track_id,
-                    sth_idx,
-                )
-
+        for track in new_tracks.values():
+            sth = track.single_target_hypotheses[sth_idx]
+            meas_idx = sth.meas_idx
+            cost_undetected[meas_idx, meas_idx] = sth.cost
+            track_id_map[meas_idx, meas_idx] = track.track_id
+            sth_id_map[meas_idx, meas_idx] = sth_idx
         return cost_undetected
 
-    def optimized_assignment_to_associations(self, solution):
-        new_target_rows = np.argwhere(solution + 1 > self.num_of_old_tracks)
-        new_target_columns = solution[new_target_rows] - self.num_of_old_tracks
-        new_associations = (self.column_row_to_new_detected_sth[target_column.item()] for target_column in new_target_columns)
-
-        previous_target_rows = np.argwhere(solution + 1 < self.num_of_old_tracks)
-        previous_target_columns = solution[previous_target_rows]
-
-        gen1 = (
-            self.column_row_to_detected_child_sth[target_column.item()][target_row.item()] for (target_row, target_column) in zip(previous_target_rows, previous_target_columns)
-        )
-        previous_target_associations = (Association(track_id, sth_id) for (track_id, parent_sth_id, child_idx, sth_id) in gen1)
-        result = itertools.chain(new_associations, previous_target_associations)
-        return list(result)
-
     def assignment_to_associations(self, solution):
-        associations = []
-        for measurement_row, target_column in np.ndenumerate(solution):
-            if target_column + 1 > self.num_of_old_tracks:
-                # assignment is to new target
-                track_id, sth_id = self.column_row_to_new_detected_sth[target_column - self.num_of_old_tracks]
-            else:
-                # assignment is to a previously detected target
-                (
-                    track_id,
-                    parent_sth_id,
-                    child_idx,
-                    _,
-                ) = self.column_row_to_detected_child_sth[
-                    target_column
-                ][measurement_row[0]]
-                sth_id = self.old_tracks[track_id].single_target_hypotheses[parent_sth_id].detection_hypotheses[child_idx].sth_id
-            associations.append(Association(track_id, sth_id))
-        return associations
+        solution = np.asarray(solution).ravel()
+        rows = np.arange(len(solution))
+        track_ids = self.track_id_map[rows, solution].tolist()
+        sth_ids = self.sth_id_map[rows, solution].tolist()
+        return list(map(Association, track_ids, sth_ids))
 
 
 class AssignmentSolver:
@@ -103,32 +107,33 @@ class AssignmentSolver:
         measurements,
         num_of_desired_hypotheses,
         max_murty_steps=None,
+        cost_buffer: CostMatrixBuffer = None,
     ) -> None:
         assert len(measurements) > 0
         self.global_hypothesis = global_hypothesis
-        self.cost_matrix = CostMatrix(global_hypothesis, old_tracks, new_tracks, measurements)
+        self.cost_matrix = CostMatrix(global_hypothesis, old_tracks, new_tracks, measurements, cost_buffer)
         self.num_of_desired_hypotheses = num_of_desired_hypotheses
         self.max_murty_steps = max_murty_steps or self.get_murty_steps()
-
-        if self.cost_matrix.cost_matrix.size == 0:
-            return
+        self._empty = self.cost_matrix.cost_matrix.size == 0
 
     def __repr__(self) -> str:
         return self.__class__.__name__ + (f"cost_matrix={self.cost_matrix}, )")
 
     def get_murty_steps(self):
-        # TODO add docstring
-        return int(np.ceil(np.exp(self.global_hypothesis.log_weight) * self.num_of_desired_hypotheses))
+        """Number of best assignments to draw, proportional to the weight of the current global hypothesis."""
+        return math.ceil(math.exp(self.global_hypothesis.log_weight) * self.num_of_desired_hypotheses)
 
     def solve(self) -> List[GlobalHypothesis]:
         lg.debug(f"\n Current global hypo = \n{self.global_hypothesis}")
         lg.debug(f"\n Cost matrix = \n{self.cost_matrix}")
-        murty_solver = Murty(self.cost_matrix.cost_matrix)
+        if self._empty:
+            self.cost_matrix.release()
+            return []
+        murty_solver = MurtySolver(self.cost_matrix.cost_matrix)
         new_global_hypotheses = []
 
         for _murty_iteration in range(self.max_murty_steps):
             status, solution_cost, murty_solution = murty_solver.draw()
-            murty_solution = murty_solution
             lg.debug(f"murty solution = {murty_solution}")
 
             if not status:
@@ -139,6 +144,7 @@ class AssignmentSolver:
                 current_association = self.cost_matrix.assignment_to_associations(murty_solution)
                 new_global_hypotheses.append(GlobalHypothesis(log_weight=current_log_weight, associations=current_association))
 
+        self.cost_matrix.release()
         return new_global_hypotheses
 
 
@@ -67,15 +67,13 @@ class MultiBernouilliMixture:
 
     def gating(self, z: np.ndarray, density_handler, meas_model: MeasurementModel, gating_size):
         gating_matrix = defaultdict(lambda: defaultdict(lambda: False))
-        used_measurement_detected_indices = np.full(shape=[len(z)], fill_value=False)
 
         for track_id, track in self.tracks.items():
             for sth_id, sth in track.single_target_hypotheses.items():
-                gating_matrix[track_id][sth_id][1] = density_handler.ellipsoidal_gating(sth.bernoulli.state, z, meas_model, gating_size)
-                used_measurement_detected_indices = np.logical_or(
-                    used_measurement_detected_indices,
-                    gating_matrix[track_id][sth_id],
-                )
+                _, gating_matrix[track_id][sth_id] = density_handler.ellipsoidal_gating(sth.bernoulli.state, z, meas_model, gating_size)
+
+        gated_rows = [meas_in_gate for track_gates in gating_matrix.values() for meas_in_gate in track_gates.values() if meas_in_gate is not None and len(meas_in_gate) == len(z)]
+        used_measurement_detected_indices = np.any(gated_rows, axis=0) if gated_rows else np.full(shape=[len(z)], fill_value=False)
 
         return (gating_matrix, used_measurement_detected_indices)
 
@@ -0,0 +1,84 @@
+import heapq
+import itertools
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+
+class MurtySolver:
+    """Enumerates assignments of a (rows x columns) cost matrix in order of increasing cost.
+
+    Implements Murty's partitioning. Subproblems are solved lazily: a child subproblem is
+    pushed into the candidates heap with a lower bound of its cost and is solved only
+    when it reaches the top of the heap, so subproblems ranked after the last drawn
+    assignment are never solved. The lower bound is the larger of the parent cost and
+    the relaxation where every free row takes its cheapest allowed column.
+
+    Every subproblem keeps its constrained cost matrix, children of a partition are
+    derived from it one forced cell at a time.
+
+    Every row has to be assigned, np.inf marks forbidden cells.
+    """
+
+    def __init__(self, cost_matrix: np.ndarray):
+        self.cost_matrix = np.asarray(cost_matrix, dtype=np.float64)
+        self._counter = itertools.count()
+        self._candidates = []
+        root = self._solve(self.cost_matrix)
+        if root is not None:
+            self._push(*root, forced=(), cost_matrix=self.cost_matrix, is_solved=True)
+
+    def draw(self) -> Tuple[bool, float, Optional[np.ndarray]]:
+        """Returns (status, cost, solution) of the next best assignment,
+        solution[row] is the column assigned to the row."""
+        while self._candidates:
+            cost, _, is_solved, solution, forced, cost_matrix = heapq.heappop(self._candidates)
+            if not is_solved:
+                solved = self._solve(cost_matrix)
+                if solved is not None:
+                    self._push(*solved, forced=forced, cost_matrix=cost_matrix, is_solved=True)
+                continue
+            self._partition(cost, solution, forced, cost_matrix)
+            return True, cost, solution
+        return False, np.inf, None
+
+    def _push(self, cost, solution, forced, cost_matrix, is_solved):
+        heapq.heappush(self._candidates, (cost, next(self._counter), is_solved, solution, forced, cost_matrix))
+
+    def _partition(self, cost, solution, forced, cost_matrix):
+        forced_rows = {row for row, _ in forced}
+        free_rows = [row for row in range(len(solution)) if row not in forced_rows]
+        children_forced = forced
+        children_cost_matrix = cost_matrix.copy()
+        for row in free_rows:
+            column = solution[row]
+            child_cost_matrix = children_cost_matrix.copy()
+            child_cost_matrix[row, column] = np.inf
+            lower_bound = self._lower_bound(child_cost_matrix)
+            if np.isfinite(lower_bound):
+                self._push(max(cost, lower_bound), None, forced=children_forced, cost_matrix=child_cost_matrix, is_solved=False)
+
+            # next children keep (row, column) assigned
+            forced_cost = children_cost_matrix[row, column]
+            children_cost_matrix[row, :] = np.inf
+            children_cost_matrix[:, column] = np.inf
+            children_cost_matrix[row, column] = forced_cost
+            children_forced = children_forced + ((row, column),)
+
+    @staticmethod
+    def _lower_bound(cost_matrix: np.ndarray) -> float:
+        return cost_matrix.min(axis=1).sum()
+
+    @staticmethod
+    def _solve(cost_matrix: np.ndarray):
+        try:
+            rows, columns = linear_sum_assignment(cost_matrix)
+        except ValueError:  # infeasible subproblem
+            return None
+        cost = cost_matrix[rows, columns].sum()
+        if len(rows) < cost_matrix.shape[0] or not np.isfinite(cost):
+            return None
+        solution = np.empty(cost_matrix.shape[0], dtype=np.int64)
+        solution[rows] = columns
+        return cost, solution
@@ -1,13 +1,12 @@
-from copy import deepcopy
-from functools import partial
+import math
 from typing import List, Tuple
 
 import numpy as np
-import scipy
 
 from src.common import (
     GaussianDensity,
     GaussianMixture,
+    GaussianMixtureArrays,
     Observation,
     ObservationList,
     normalize_log_weights,
@@ -24,7 +23,7 @@ from .track import Track
 class PoissonRFS:
     def __init__(self, intensity: GaussianMixture):
         assert isinstance(intensity, GaussianMixture)
-        self.intensity = deepcopy(intensity)
+        self.intensity = GaussianMixtureArrays.from_gaussian_mixture(intensity)
 
     def __repr__(self):
         return self.intensity.__repr__()
@@ -39,19 +38,19 @@ class PoissonRFS:
         meas_model: MeasurementModel,
         detection_probability: float,
     ) -> List[Track]:
-        detected_update_func = partial(
-            PoissonRFS.detected_update,
-            intensity=self.intensity,
-            meas_model=meas_model,
-            detection_probability=detection_probability,
-            clutter_intensity=clutter_intensity,
-        )
-
-        new_single_target_hypotheses = [detected_update_func((meas_idx, measurements[meas_idx])) for meas_idx in range(len(measurements))]
+        log_detection_probability = math.log(detection_probability)
 
         new_tracks = {}
-        for meas_idx in range(len(measurements)):
-            new_track = Track.from_sth(new_single_target_hypotheses[meas_idx])
+        for meas_idx, measurement in enumerate(measurements):
+            new_single_target_hypothesis = PoissonRFS.detected_update(
+                (meas_idx, measurement),
+                intensity=self.intensity,
+                meas_model=meas_model,
+                detection_probability=detection_probability,
+                clutter_intensity=clutter_intensity,
+                log_detection_probability=log_detection_probability,
+            )
+            new_track = Track.from_sth(new_single_target_hypothesis)
             new_tracks[new_track.track_id] = new_track
         return new_tracks
 
@@ -63,6 +62,7 @@ class PoissonRFS:
         detection_probability: float,
         clutter_intensity: float,
         density=GaussianDensity,
+        log_detection_probability: float = None,
     ) -> SingleTargetHypothesis:
         """Creates a new local hypothesis by updating the PPP
         with measurement and calculates the corresponding
@@ -80,28 +80,30 @@ class PoissonRFS:
         """
         meas_idx, measurement = meas
         assert isinstance(meas_model, MeasurementModel)
+        if log_detection_probability is None:
+            log_detection_probability = math.log(detection_probability)
         # 1. For each mixture component in the PPP intensity, perform Kalman update and
         # calculate the predicted likelihood for each detection inside the corresponding ellipsoidal gate.
 
-        # TODO remove redundant deep copy - it takes 0.012 secs
         (
-            updated_ppp_components,
+            updated_means,
+            updated_covariances,
             loglikelihoods,
-        ) = GaussianDensity.update_states_with_likelihoods_by_single_measurement(intensity, measurement, meas_model)
+        ) = GaussianDensity.update_states_with_likelihoods_by_single_measurement_vectorized(intensity, measurement, meas_model)
 
         # Compute predicted likelihood
         assert len(intensity) == len(loglikelihoods)
-        log_weights = np.array([np.log(detection_probability) + ppp_component.log_weight + loglikelihood for ppp_component, loglikelihood in zip(intensity, loglikelihoods)])
+        log_weights = log_detection_probability + intensity.log_weights_np + loglikelihoods
 
         # 2. Perform Gaussian moment matching for the updated object state densities
         # resulted from being updated by the same detection.
         normalized_log_weights, log_sum = normalize_log_weights(log_weights)
-        merged_state = density.moment_matching_vectorized(normalized_log_weights, updated_ppp_components)
+        merged_state = density.moment_matching_arrays(np.asarray(normalized_log_weights), updated_means, updated_covariances)
 
         # 3. The returned likelihood should be the sum of the predicted likelihoods calculated f
         # or each mixture component in the PPP intensity and the clutter intensity.
         # (You can make use of the normalizeLogWeights function to achieve this.)
-        log_likelihood = scipy.special.logsumexp([log_sum, np.log(clutter_intensity)])
+        log_likelihood = np.logaddexp(log_sum, math.log(clutter_intensity))
 
         # 4. The returned existence probability of the Bernoulli component
         # is the ratio between the sum of the predicted likelihoods
@@ -123,11 +125,10 @@ class PoissonRFS:
     @Timer(name="update ppp componentns for missed detetion")
     def undetected_update(self, detection_probability) -> None:
         """Performs PPP update for missed detection."""
-        for ppp_component in self.intensity:
-            ppp_component.log_weight += np.log(1 - detection_probability)
+        self.intensity.log_weights += math.log1p(-detection_probability)
 
     def prune(self, threshold: float) -> None:
-        self.intensity = GaussianMixture([ppp_component for ppp_component in self.intensity if ppp_component.log_weight > threshold])
+        self.intensity = self.intensity.select(self.intensity.log_weights > threshold)
 
     def predict(
         self,
@@ -142,9 +143,11 @@ class PoissonRFS:
         assert isinstance(survival_probability, float)
         assert isinstance(dt, float)
 
-        for ppp_component in self.intensity:
-            ppp_component.log_weight += np.log(survival_probability)
-            ppp_component.gaussian = density.predict(ppp_component.gaussian, motion_model, dt)
+        if not self.intensity:
+            return
+
+        self.intensity.means, self.intensity.covs = density.predict_vectorized(self.intensity, motion_model, dt)
+        self.intensity.log_weights += math.log(survival_probability)
 
     def birth(self, new_components: GaussianMixture):
         """Incorporate PPP birth intensity into PPP intensity
@@ -155,7 +158,7 @@ class PoissonRFS:
             [description]
         """
         assert isinstance(new_components, GaussianMixture)
-        self.intensity.extend(deepcopy(new_components))
+        self.intensity.extend(new_components)
 
     def gating(
         self,
@@ -165,10 +168,7 @@ class PoissonRFS:
         gating_size: float,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Returns measurement indices inside the gate of undetected objects (PPP)"""
-        gating_matrix_undetected = np.full(shape=[self.intensity.size, len(measurements)], fill_value=False)  # poisson size x number of measurements
-        used_measurement_undetected_indices = np.full(shape=[len(measurements)], fill_value=False)
-
-        for ppp_idx in range(self.intensity.size):
-            _, gating_matrix_undetected[ppp_idx, :] = density_handler.ellipsoidal_gating(self.intensity[ppp_idx].gaussian, measurements, meas_model, gating_size)
-            used_measurement_undetected_indices = np.logical_or(used_measurement_undetected_indices, gating_matrix_undetected[ppp_idx])
+        # poisson size x number of measurements
+        gating_matrix_undetected = density_handler.ellipsoidal_gating_vectorized(self.intensity, measurements, meas_model, gating_size)
+        used_measurement_undetected_indices = gating_matrix_undetected.any(axis=0)
         return (gating_matrix_undetected, used_measurement_undetected_indices)
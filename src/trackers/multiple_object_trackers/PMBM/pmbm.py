@@ -16,6 +16,7 @@ from src.trackers.multiple_object_trackers.PMBM.common import (
     AssignmentSolver,
     Association,
     BirthModel,
+    CostMatrixBuffer,
     GlobalHypothesis,
     MultiBernouilliMixture,
     PoissonRFS,
@@ -81,6 +82,7 @@ class PMBM:
 
         self.PPP = PoissonRFS(intensity=initial_PPP_intensity)
         self.MBM = MultiBernouilliMixture()
+        self._cost_buffer = CostMatrixBuffer()
         self.assingner_pool = Pool(processes=6)
         Track.current_idx = 0
 
@@ -183,17 +185,20 @@ class PMBM:
                 # parallel_global_hypo = self.assingner_pool.map(solve, assignment_problems
                 new_global_hypotheses = itertools.chain.from_iterable(parallel_global_hypo)
             else:
-                assignment_problems = [
-                    AssignmentSolver(
-                        global_hypothesis=global_hypothesis,
-                        old_tracks=self.MBM.tracks,
-                        new_tracks=new_tracks,
-                        measurements=measurements,
-                        num_of_desired_hypotheses=self.max_number_of_hypotheses,
-                    )
-                    for global_hypothesis in self.MBM.global_hypotheses
-                ]
-                new_global_hypotheses = itertools.chain.from_iterable([problem.solve() for problem in assignment_problems])
+                # problems share the cost matrix buffer, so each one is solved before the next is built
+                new_global_hypotheses = itertools.chain.from_iterable(
+                    [
+                        AssignmentSolver(
+                            global_hypothesis=global_hypothesis,
+                            old_tracks=self.MBM.tracks,
+                            new_tracks=new_tracks,
+                            measurements=measurements,
+                            num_of_desired_hypotheses=self.max_number_of_hypotheses,
+                            cost_buffer=self._cost_buffer,
+                        ).solve()
+                        for global_hypothesis in self.MBM.global_hypotheses
+                    ]
+                )
 
             with Timer(name="Prepation for the next step"):
                 self.update_tree()
@@ -1,4 +1,5 @@
 import numpy as np
+import scipy.linalg
 from scipy.stats import chi2
 from tqdm import tqdm as tqdm
 
@@ -23,6 +24,92 @@ class BaseTracker:
         raise NotImplementedError
 
 
+def _select_nearest_neighbour(predicted_loglikelihoods: np.ndarray, log_detection_factor: float, w_missdetection: float):
+    """Compares the weight of the missed detection hypothesis and the weight of the object detection
+    hypothesis using the nearest neighbour measurement
+
+    Returns:
+        max_k (int or None): index of the nearest neighbour measurement, None if the missed detection wins
+    """
+    w_detection_k = predicted_loglikelihoods + log_detection_factor
+    max_k = np.argmax(w_detection_k)
+    return max_k if w_missdetection < w_detection_k[max_k] else None
+
+
+def _nearest_neighbour_linear_step(
+    x: np.ndarray,
+    P: np.ndarray,
+    z: np.ndarray,
+    F: np.ndarray,
+    Q: np.ndarray,
+    H: np.ndarray,
+    R: np.ndarray,
+    gating_size: float,
+    log_detection_factor: float,
+    w_missdetection: float,
+):
+    """Nearest neighbour prediction and update for linear motion and measurement models,
+    computed on plain arrays in a single pass.
+
+    NearestNeighbourTracker.predict/update is the reference implementation and works for any models.
+    This fast path gives the same result up to rounding, but computes it differently:
+    bounding box prefilter before the gate, one Cholesky factor of S shared by the likelihoods
+    and the gain, and the Joseph form covariance update. Changes of the tracker's logic
+    go to the reference path first and are mirrored here, test_nearest_neighbour_linear_step_matches_generic_path
+    keeps both paths in agreement.
+
+    Returns:
+        x (np.ndarray): updated state vector
+        P (np.ndarray): updated state covariance
+    """
+    # Prediction
+    x = F @ x
+    P = F @ P @ F.T + Q
+    if z.size == 0:
+        return x, P
+
+    # Gating
+    z_bar = H @ x
+    z_diff = z - z_bar
+    S_gate = H @ P @ H.T
+    S_gate = 0.5 * (S_gate + S_gate.T)
+    # The gating ellipse lies inside the box |z_diff_i| < sqrt(gating_size * S_gate_ii),
+    # only measurements within the box reach the Mahalanobis test
+    in_box = np.all(np.square(z_diff) < gating_size * np.diag(S_gate), axis=1)
+    if not in_box.any():
+        return x, P
+    z_diff = z_diff[in_box]
+    try:
+        in_gate = np.einsum("mi,ij,mj->m", z_diff, np.linalg.inv(S_gate), z_diff) < gating_size
+    except np.linalg.LinAlgError:
+        return x, P
+    if not in_gate.any():
+        return x, P
+    z_diff = z_diff[in_gate]
+
+    # Predicted likelihood for each measurement in the gate
+    S = H @ P @ H.T + R
+    S = 0.5 * (S + S.T)
+    # S does not depend on the measurement, factorize it once and share it
+    # between the likelihoods of all gated measurements and the Kalman gain
+    try:
+        S_cho = scipy.linalg.cho_factor(S, lower=True)
+    except np.linalg.LinAlgError:
+        return x, P
+    log_det_S = 2 * np.log(np.diag(S_cho[0])).sum()
+    Machlanobis_dist = np.einsum("ij,ji->i", z_diff, scipy.linalg.cho_solve(S_cho, z_diff.T))
+    predicted_loglikelihoods = -0.5 * (Machlanobis_dist + log_det_S + len(z_bar) * np.log(2 * np.pi))
+
+    max_k = _select_nearest_neighbour(predicted_loglikelihoods, log_detection_factor, w_missdetection)
+    if max_k is not None:
+        K = scipy.linalg.cho_solve(S_cho, H @ P).T
+        x = x + K @ z_diff[max_k]
+        # Joseph form keeps P symmetric positive semidefinite without re-symmetrization
+        A = np.eye(x.shape[0]) - K @ H
+        P = A @ P @ A.T + K @ R @ K.T
+    return x, P
+
+
 class NearestNeighbourTracker(BaseTracker):
     def __init__(
         self,
@@ -42,6 +129,21 @@ class NearestNeighbourTracker(BaseTracker):
         super().__init__()
 
     def step(self, measurements: np.ndarray, dt: float):
+        if self.motion_model.is_linear and self.meas_model.is_linear:
+            x, P = _nearest_neighbour_linear_step(
+                self.state.x,
+                self.state.P,
+                measurements,
+                self.motion_model.F(self.state.x, dt),
+                self.motion_model.Q(dt),
+                self.meas_model.H(self.state.x),
+                self.meas_model.R,
+                self.gating_size,
+                np.log(self.sensor_model.P_D / self.sensor_model.intensity_c),
+                1 - self.sensor_model.P_D,
+            )
+            self.state = Gaussian(x, P)
+            return self.estimate()
         self.predict(dt)
         self.update(measurements, dt)
         return self.estimate()
@@ -60,14 +162,8 @@ class NearestNeighbourTracker(BaseTracker):
         predicted_loglikelihoods = GaussianDensity.predict_loglikelihood(state_pred=self.state, z=meas_in_gate, measurement_model=self.meas_model)
 
         # Hypothesis evaluation
-        w_detection_k = predicted_loglikelihoods + np.log(self.sensor_model.P_D / self.sensor_model.intensity_c)
-        w_missdetection = 1 - self.sensor_model.P_D
-
-        # Compare the weight of the missed detection
-        # hypothesis and the weight of the object detection hypothesis
-        # using the nearest neighbour measurement
-        max_k = np.argmax(w_detection_k)
-        if w_missdetection < w_detection_k[max_k]:
+        max_k = _select_nearest_neighbour(predicted_loglikelihoods, np.log(self.sensor_model.P_D / self.sensor_model.intensity_c), 1 - self.sensor_model.P_D)
+        if max_k is not None:
             # nearest neighbour measurement
             self.state = GaussianDensity.update(state_pred=self.state, z=meas_in_gate[max_k], measurement_model=self.meas_model)
 
@@ -133,7 +229,6 @@ class ProbabilisticDataAssociationTracker(BaseTracker):
         multi_hypotheses = [self.state]  # no detection hypothesis
 
         # 3. Create object detection hypothesis for each detection inside the gate
-        predicted_likelihood = []
         for z_ingate in meas_in_gate:
             multi_hypotheses.append(
                 GaussianDensity.update(
@@ -142,14 +237,12 @@ class ProbabilisticDataAssociationTracker(BaseTracker):
                     measurement_model=self.meas_model,
                 )
             )
-
-            ll = GaussianDensity.predict_loglikelihood(state_pred=self.state, z=z_ingate[None, :], measurement_model=self.meas_model)[0]
-            predicted_likelihood.append(ll)
+        predicted_likelihood = GaussianDensity.predict_loglikelihood(state_pred=self.state, z=meas_in_gate, measurement_model=self.meas_model)
 
         # Hypothesis evaluation
         # detection
         w_theta_factor = np.log(self.sensor_model.P_D / self.sensor_model.intensity_c)
-        w_theta_k = np.array(predicted_likelihood) + w_theta_factor
+        w_theta_k = predicted_likelihood + w_theta_factor
 
         hypotheses_weights_log = [np.log(w_theta_0)] + w_theta_k.tolist()
         log_w, log_sum_ = normalize_log_weights(hypotheses_weights_log)
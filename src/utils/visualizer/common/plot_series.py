@@ -20,6 +20,27 @@ OBJECT_MEASUREMENT_COLOR = "b"
 logging.getLogger("matplotlib").setLevel(logging.WARNING)
 
 
+def scenes_to_arrays(scenes):
+    """Flattens per timestep scenes {object_id: Gaussian} into contiguous arrays
+
+    Returns:
+        timesteps (np.ndarray (K)): timestep of every state
+        object_ids (np.ndarray (K)): object id of every state
+        states (np.ndarray (K x N)): state vectors, N - state dimension
+    """
+    timesteps, object_ids, states = [], [], []
+    for timestep, scene in enumerate(scenes):
+        if not scene:
+            continue
+        for object_id, state in scene.items():
+            timesteps.append(timestep)
+            object_ids.append(object_id)
+            states.append(state.x)
+    if not states:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int), np.empty((0, 2))
+    return np.array(timesteps), np.array(object_ids), np.array(states)
+
+
 def plot_object_data(series: ObjectData, ax):
     if series is None:
         return
@@ -81,25 +102,28 @@ def plot_measurement_scene(
 ):
     if meas_data is None:
         return
-    for timestep, measurements, sources in meas_data:
-        object_observations, clutter_observation = (
-            measurements[sources != -1],
-            measurements[sources == -1],
-        )
-        colors = [OBJECT_COLORS[int(object_id)] for object_id in sources[sources != -1]]
+    if len(meas_data) > 0:
+        # all timesteps are drawn with one scatter call per axis
+        timesteps = np.concatenate([np.full(len(sources), timestep) for timestep, _, sources in meas_data])
+        measurements = np.concatenate([measurements for _, measurements, _ in meas_data])
+        sources = np.concatenate([sources for _, _, sources in meas_data])
+        is_object = sources != -1
+        object_observations, clutter_observation = measurements[is_object], measurements[~is_object]
+        object_timesteps, clutter_timesteps = timesteps[is_object], timesteps[~is_object]
+        colors = [OBJECT_COLORS[int(object_id)] for object_id in sources[is_object]]
 
         ax_2d.scatter(object_observations[..., 0], object_observations[..., 1], color=colors, marker=OBJECT_MEASUREMENT_MARKER)
         ax_2d.scatter(clutter_observation[..., 0], clutter_observation[..., 1], color=clutter_color, marker=clutter_marker)
         if ax_xt is not None:
             if object_observations[..., 0].size > 0:
-                ax_xt.scatter([timestep] * len(object_observations[..., 0]), object_observations[..., 0], color=colors, marker=OBJECT_MEASUREMENT_MARKER)
+                ax_xt.scatter(object_timesteps, object_observations[..., 0], color=colors, marker=OBJECT_MEASUREMENT_MARKER)
             if clutter_observation[..., 0].size > 0:
-                ax_xt.scatter([timestep] * len(clutter_observation[..., 0]), clutter_observation[..., 0], color=clutter_color, marker=clutter_marker)
+                ax_xt.scatter(clutter_timesteps, clutter_observation[..., 0], color=clutter_color, marker=clutter_marker)
         if ax_yt is not None:
             if object_observations[..., 1].size > 0:
-                ax_yt.scatter(object_observations[..., 1], [timestep] * len(object_observations[..., 1]), color=colors, marker=OBJECT_MEASUREMENT_MARKER)
+                ax_yt.scatter(object_observations[..., 1], object_timesteps, color=colors, marker=OBJECT_MEASUREMENT_MARKER)
             if clutter_observation[..., 1].size > 0:
-                ax_yt.scatter(clutter_observation[..., 1], [timestep] * len(clutter_observation[..., 1]), color=clutter_color, marker=clutter_marker)
+                ax_yt.scatter(clutter_observation[..., 1], clutter_timesteps, color=clutter_color, marker=clutter_marker)
 
     handles = [
         Line2D([0], [0], marker=clutter_marker, color=clutter_color, label="clutter"),
@@ -0,0 +1,39 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from src.trackers.multiple_object_trackers.PMBM.common.murty_solver import MurtySolver
+
+
+def brute_force_costs(cost_matrix):
+    num_rows, num_columns = cost_matrix.shape
+    costs = (cost_matrix[np.arange(num_rows), list(columns)].sum() for columns in itertools.permutations(range(num_columns), num_rows))
+    return sorted(cost for cost in costs if np.isfinite(cost))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_murty_solver_draws_all_assignments_in_order(seed):
+    rng = np.random.default_rng(seed)
+    num_meas, num_old_tracks = rng.integers(1, 5), rng.integers(0, 4)
+    # (detected | undetected) layout of the PMBM cost matrix
+    cost_matrix = np.full((num_meas, num_old_tracks + num_meas), np.inf)
+    cost_matrix[:, :num_old_tracks] = np.where(rng.random((num_meas, num_old_tracks)) < 0.7, rng.normal(size=(num_meas, num_old_tracks)), np.inf)
+    cost_matrix[np.arange(num_meas), num_old_tracks + np.arange(num_meas)] = rng.normal(size=num_meas)
+
+    murty_solver = MurtySolver(cost_matrix)
+    drawn_costs = []
+    status, cost, solution = murty_solver.draw()
+    while status:
+        np.testing.assert_allclose(cost_matrix[np.arange(num_meas), solution].sum(), cost)
+        drawn_costs.append(cost)
+        status, cost, solution = murty_solver.draw()
+
+    np.testing.assert_allclose(drawn_costs, brute_force_costs(cost_matrix))
+
+
+def test_murty_solver_infeasible():
+    murty_solver = MurtySolver(np.full((2, 2), np.inf))
+    status, _, solution = murty_solver.draw()
+    assert not status
+    assert solution is None
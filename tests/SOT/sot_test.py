@@ -2,8 +2,11 @@ import os
 
 import numpy as np
 import pytest
+from scipy.stats import chi2
 
 from src.common import Gaussian
+from src.configs import SensorModelConfig
+from src.measurement_models import ConstantVelocityMeasurementModel
 from src.motion_models import ConstantVelocityMotionModel
 from src.scenarios.initial_conditions import all_object_scenarios
 from src.trackers.single_object_trackers import (
@@ -30,3 +33,24 @@ def tracker(request):
         "initial_state": Gaussian(x=np.array([-40, -40, 15.0, 5.0]), P=100.0 * np.eye(4)),
     }
     yield (request.param, tracker_hyperparams)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_nearest_neighbour_linear_step_matches_generic_path(seed):
+    rng = np.random.default_rng(seed)
+    sensor_model = SensorModelConfig(P_D=0.9, lambda_c=10.0, range_c=np.array([[-1000, 1000], [-1000, 1000]]))
+    tracker_params = {
+        "gating_size": chi2.ppf(0.99, df=2),
+        "meas_model": ConstantVelocityMeasurementModel(sigma_r=10.0),
+        "sensor_model": sensor_model,
+        "motion_model": ConstantVelocityMotionModel(random_state=42, sigma_q=5.0),
+        "initial_state": Gaussian(x=np.array([-40, -40, 15.0, 5.0]), P=100.0 * np.eye(4)),
+    }
+    linear_tracker, generic_tracker = NearestNeighbourTracker(**tracker_params), NearestNeighbourTracker(**tracker_params)
+    for _ in range(20):
+        measurements = np.vstack([linear_tracker.state.x[:2] + rng.normal(0.0, 10.0, size=(2, 2)), rng.uniform(-1000, 1000, size=(3, 2))])
+        linear_tracker.step(measurements, 1.0)
+        generic_tracker.predict(1.0)
+        generic_tracker.update(measurements, 1.0)
+        np.testing.assert_allclose(linear_tracker.state.x, generic_tracker.state.x, rtol=1e-6, atol=1e-6)
+        np.testing.assert_allclose(linear_tracker.state.P, generic_tracker.state.P, rtol=1e-6, atol=1e-6)
@@ -2,7 +2,7 @@ import numpy as np
 from scipy.stats import chi2
 
 from src.common.gaussian_density import GaussianDensity
-from src.common.state import Gaussian
+from src.common.state import Gaussian, GaussianMixture, WeightedGaussian
 from src.configs import GroundTruthConfig, Object, SensorModelConfig
 from src.measurement_models import ConstantVelocityMeasurementModel
 from src.motion_models import ConstantVelocityMotionModel
@@ -55,3 +55,38 @@ def test_ellipsoidal_gating():
             measurement_model=meas_model,
             gating_size=gating_size,
         )
+
+
+def test_ellipsoidal_gating_vectorized():
+    meas_model = ConstantVelocityMeasurementModel(sigma_r=10.0)
+    gating_size = chi2.ppf(0.99, df=meas_model.dim)
+    states = GaussianMixture(
+        [
+            WeightedGaussian(0.0, Gaussian(x=np.array([0.0, 0.0, 5.0, 5.0]), P=np.eye(4))),
+            WeightedGaussian(0.0, Gaussian(x=np.array([10.0, -5.0, 0.0, 0.0]), P=25.0 * np.eye(4))),
+        ]
+    )
+    z = np.array([[1.0, 1.0], [10.0, -10.0], [100.0, 100.0]])
+
+    gating_matrix = GaussianDensity.ellipsoidal_gating_vectorized(states, z, meas_model, gating_size)
+
+    gating_matrix_ref = np.array([GaussianDensity.ellipsoidal_gating(component.gaussian, z, meas_model, gating_size)[1] for component in states])
+    np.testing.assert_array_equal(gating_matrix, gating_matrix_ref)
+    np.testing.assert_array_equal(gating_matrix, [[True, False, False], [True, True, False]])
+
+
+def test_ellipsoidal_gating_vectorized_singular_component():
+    meas_model = ConstantVelocityMeasurementModel(sigma_r=10.0)
+    gating_size = chi2.ppf(0.99, df=meas_model.dim)
+    states = GaussianMixture(
+        [
+            WeightedGaussian(0.0, Gaussian(x=np.array([0.0, 0.0, 5.0, 5.0]), P=np.eye(4))),
+            WeightedGaussian(0.0, Gaussian(x=np.array([10.0, -5.0, 0.0, 0.0]), P=np.zeros((4, 4)))),
+        ]
+    )
+    z = np.array([[1.0, 1.0], [10.0, -10.0], [100.0, 100.0]])
+
+    gating_matrix = GaussianDensity.ellipsoidal_gating_vectorized(states, z, meas_model, gating_size)
+
+    # only the component with singular S is out of every gate
+    np.testing.assert_array_equal(gating_matrix, [[True, False, False], [False, False, False]])
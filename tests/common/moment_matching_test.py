@@ -26,3 +26,18 @@ def test_moment_matching():
         d = result.x - states[idx].x
         expected_cov += (states[idx].P + d @ d.T) * log_weights_exp[idx]
     np.testing.assert_array_almost_equal(result.P, expected_cov)
+
+
+def test_moment_matching_arrays_matches_vectorized():
+    weights = np.log(np.array([0.2, 0.5, 0.3], dtype=float))
+    states = [
+        Gaussian(x=np.array([1, 2, 0, 1], dtype=float), P=np.eye(4)),
+        Gaussian(x=np.array([3, 4, 1, 0], dtype=float), P=2 * np.eye(4)),
+        Gaussian(x=np.array([-1, 0, 2, 2], dtype=float), P=np.diag([1.0, 2.0, 3.0, 4.0])),
+    ]
+
+    expected = GaussianDensity.moment_matching_vectorized(weights, states)
+    result = GaussianDensity.moment_matching_arrays(weights, np.array([state.x for state in states]), np.array([state.P for state in states]))
+
+    np.testing.assert_array_almost_equal(result.x, expected.x)
+    np.testing.assert_array_almost_equal(result.P, expected.P)
@@ -30,3 +30,20 @@ def test_predict_likelihood_shore_distance():
         measurement_model=meas_model,
     )
     np.testing.assert_allclose(predicted_likelihood, -8.2114, rtol=0.01)
+
+
+def test_predict_likelihood_batch():
+    state = Gaussian(x=np.array([20, 20, 10, 10]), P=np.eye(4))
+    meas_model = ConstantVelocityMeasurementModel(5.0)
+    measurements = np.array([[-100, -100], [11, 11], [20, 25]])
+    predicted_likelihood = GaussianDensity.predict_loglikelihood(
+        state,
+        z=measurements,
+        measurement_model=meas_model,
+    )
+    assert predicted_likelihood.shape == (3,)
+    np.testing.assert_allclose(predicted_likelihood[:2], [-558.9421, -8.2114], rtol=0.01)
+    np.testing.assert_allclose(
+        predicted_likelihood,
+        [GaussianDensity.predict_loglikelihood(state, z=measurement.reshape([1, 2]), measurement_model=meas_model)[0] for measurement in measurements],
+    )
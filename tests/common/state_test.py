@@ -3,7 +3,12 @@ import unittest
 import numpy as np
 import pytest
 
-from src.common.state import Gaussian
+from src.common.state import (
+    Gaussian,
+    GaussianMixture,
+    GaussianMixtureArrays,
+    WeightedGaussian,
+)
 
 
 TOL = 1e-4
@@ -33,3 +38,28 @@ class Test_Gaussian(unittest.TestCase):
         with pytest.raises(Exception) as e_info:
             state = Gaussian(x=np.array([0, 0, 0]), P=np.eye(2))  # noqa F841
         assert str(e_info.value) == "size of vector should be equal P column size!"
+
+
+class Test_GaussianMixture(unittest.TestCase):
+    def test_log_weights_np_follows_components(self):
+        mixture = GaussianMixture([WeightedGaussian(np.log(0.1), Gaussian(x=np.zeros(2), P=np.eye(2))), WeightedGaussian(np.log(0.2), Gaussian(x=np.ones(2), P=np.eye(2)))])
+        np.testing.assert_allclose(mixture.log_weights_np, np.log([0.1, 0.2]), atol=TOL)
+
+        mixture[0].log_weight += np.log(0.5)
+        np.testing.assert_allclose(mixture.log_weights_np, np.log([0.05, 0.2]), atol=TOL)
+
+
+class Test_GaussianMixtureArrays(unittest.TestCase):
+    def test_round_trip_and_extend(self):
+        mixture = GaussianMixture([WeightedGaussian(np.log(0.1), Gaussian(x=np.zeros(2), P=np.eye(2))), WeightedGaussian(np.log(0.2), Gaussian(x=np.ones(2), P=2 * np.eye(2)))])
+        arrays = GaussianMixtureArrays.from_gaussian_mixture(GaussianMixture([]))
+        arrays.extend(mixture)
+        assert arrays.means.shape == (2, 2) and arrays.covs.shape == (2, 2, 2)
+        assert list(arrays.to_gaussian_mixture()) == list(mixture)
+
+        arrays.log_weights += np.log(0.5)
+        np.testing.assert_allclose(mixture.log_weights_np, np.log([0.1, 0.2]), atol=TOL)
+
+        selected = arrays.select(arrays.log_weights > np.log(0.07))
+        assert len(selected) == 1
+        assert selected[0].gaussian == mixture[1].gaussian
@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 import pytest
 
@@ -6,6 +8,13 @@ from src.measurement_models import ConstantVelocityMeasurementModel
 from src.utils.get_path import get_images_dir
 
 
+def pytest_configure(config):
+    # gif animation and the summary figure of every tracker run are slower than the tracker itself,
+    # run with ANIMATE=True / VISUALIZE=True to render them
+    os.environ.setdefault("ANIMATE", "False")
+    os.environ.setdefault("VISUALIZE", "False")
+
+
 @pytest.fixture()
 def artefacts_folder(_file_):
     yield get_images_dir(_file_)
@@ -35,7 +44,7 @@ def env_clutter_rate(request):
     yield request.param
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def env_measurement_model(request):
     yield ConstantVelocityMeasurementModel(sigma_r=10.0)
 
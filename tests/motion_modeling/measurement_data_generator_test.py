@@ -1,10 +1,7 @@
-import os
 import unittest
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-import src.utils as utils
 from src.common.state import Gaussian
 from src.configs import GroundTruthConfig, Object, SensorModelConfig
 from src.measurement_models import ConstantVelocityMeasurementModel
@@ -46,9 +43,27 @@ class Test_MeasurementData(unittest.TestCase):
 
         meas_data = MeasurementData(object_data=object_data, sensor_model=sensor_model, meas_model=meas_model)  # noqa F841  # noqa F841
 
-        OUTPUT_PICTURE = "measurements.png"
-        picture_path = os.path.join(utils.get_output_dir(), OUTPUT_PICTURE)  # noqa F841
+    def test_generate_batch(self):
+        total_time = 50
+        objects_configs = [
+            Object(
+                initial=Gaussian(x=np.array([0.0, 0.0, 10.0, 10.0]), P=np.eye(4)),
+                t_birth=10,
+                t_death=total_time,
+            )
+        ]
+        ground_truth = GroundTruthConfig(object_configs=objects_configs, total_time=total_time)
+        motion_model = ConstantVelocityMotionModel(sigma_q=5.0, random_state=42)
+        object_data = ObjectData(ground_truth_config=ground_truth, motion_model=motion_model, if_noisy=False)
+        sensor_model = SensorModelConfig(P_D=0.9, lambda_c=10.0, range_c=np.array([[-1000, 1000], [-1000, 1000]]))
+        meas_model = ConstantVelocityMeasurementModel(sigma_r=1.0)
+
+        meas_data = MeasurementData(object_data=object_data, sensor_model=sensor_model, meas_model=meas_model, random_state=42).generate_batch()
 
-        fig = plt.figure(figsize=(5, 5))  # noqa F841
-        ax = plt.subplot(111, aspect="equal")
-        ax.grid(which="both", linestyle="--", alpha=0.5)
+        assert len(meas_data) == total_time
+        for timestep, measurements, sources in meas_data:
+            assert measurements.shape == (len(sources), meas_model.dim)
+            assert set(sources) <= set(object_data[timestep].keys()) | {-1}
+            for measurement, source in zip(measurements, sources):
+                if source != -1:
+                    np.testing.assert_allclose(measurement, object_data[timestep][source].x[:2], atol=10.0)
@@ -12,3 +12,6 @@ def test_constant_velocity_measurement_model():
     assert np.allclose(model.h(state_vector), expected_measurement)
     assert np.allclose(model.H(state_vector), np.array([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]]))
     assert np.allclose(model.R, (sigma_r**2) * np.eye(2))
+    # observation matrix is built once and shared between calls
+    assert model.H(state_vector) is model.H(2 * state_vector)
+    assert not model.H(state_vector).flags.writeable
@@ -1,10 +1,14 @@
 import os
 
+import numpy as np
 import pytest
 
+from src.common.state import Gaussian
+from src.configs import GroundTruthConfig, Object
 from src.measurement_models import ConstantVelocityMeasurementModel
 from src.motion_models import ConstantVelocityMotionModel
 from src.scenarios.initial_conditions import all_object_scenarios
+from src.simulator import ObjectData
 
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
@@ -33,3 +37,14 @@ def env_detection_probability(request):
 @pytest.fixture
 def tracker():
     yield None, None
+
+
+def test_noisy_object_data_follows_motion_noise():
+    total_time = 5000
+    motion_model = ConstantVelocityMotionModel(random_state=42, sigma_q=2.0)
+    object_configs = [Object(initial=Gaussian(x=np.zeros(4), P=np.eye(4)), t_birth=0, t_death=total_time)]
+    object_data = ObjectData(ground_truth_config=GroundTruthConfig(object_configs=object_configs, total_time=total_time), motion_model=motion_model, if_noisy=True)
+
+    states = np.array([object_data[timestep][object_configs[0].id].x for timestep in range(total_time)])
+    residuals = states[1:] - np.array([motion_model.f(x, 1.0) for x in states[:-1]])
+    np.testing.assert_allclose(np.cov(residuals.T), motion_model.Q(1.0), atol=0.3)
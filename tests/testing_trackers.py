@@ -1,19 +1,43 @@
+import functools
+
 import numpy as np
 import pytest
 
-from src.run import run_tracker
+from src.run import generate_environment, run_tracker
+from src.scenarios.initial_conditions import all_object_scenarios
+
+
+TOTAL_TIME = 100
+ENV_RANGE_C = np.array([[-1000, 1000], [-1000, 1000]])
+# the same seed in every xdist worker, so every tracker of a scenario sees the same measurements
+ENV_RANDOM_STATE = 42
+
+
+@functools.lru_cache(maxsize=None)
+def build_environment(scenario_idx, env_detection_probability, env_clutter_rate, env_measurement_model):
+    """Simulates a scenario once, every tracker tested on it gets the same motion model and data"""
+    scenario = all_object_scenarios[scenario_idx]
+    env_motion_model = scenario.motion_model(sigma_q=10.0, random_state=ENV_RANDOM_STATE)
+    environment = generate_environment(
+        object_configs=scenario.object_configs,
+        total_time=TOTAL_TIME,
+        env_motion_model=env_motion_model,
+        env_meas_model=env_measurement_model,
+        env_P_D=env_detection_probability,
+        env_lambda_c=env_clutter_rate,
+        env_range_c=ENV_RANGE_C,
+        random_state=ENV_RANDOM_STATE,
+    )
+    return env_motion_model, environment
 
 
 @pytest.mark.usefixtures("env_measurement_model", "env_clutter_rate", "env_detection_probability", "filepath_fixture")
 def test_synthetic_scenario(object_motion_fixture, env_detection_probability, env_clutter_rate, env_measurement_model, tracker, filepath_fixture):
-    env_motion_model, object_motion_cfg = object_motion_fixture.motion_model(sigma_q=10.0, random_state=42), object_motion_fixture.object_configs
     tracker_constructor, tracker_params = tracker
+    scenario_idx = next(idx for idx, scenario in enumerate(all_object_scenarios) if scenario is object_motion_fixture)
+    env_motion_model, environment = build_environment(scenario_idx, env_detection_probability, env_clutter_rate, env_measurement_model)
     run_tracker(
-        object_configs=object_motion_cfg,
-        total_time=100,
-        env_P_D=env_detection_probability,
-        env_lambda_c=env_clutter_rate,
-        env_range_c=np.array([[-1000, 1000], [-1000, 1000]]),
+        environment=environment,
         env_motion_model=env_motion_model,
         env_meas_model=env_measurement_model,
         tracker=tracker_constructor,